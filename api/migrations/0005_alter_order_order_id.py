@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-27 21:13
+
+import api.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_order_total_price'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='order_id',
+            field=models.UUIDField(default=api.models.uuid7, primary_key=True, serialize=False),
+        ),
+    ]
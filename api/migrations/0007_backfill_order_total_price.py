@@ -0,0 +1,34 @@
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import F, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_total_price(apps, schema_editor):
+    # Orders created before 0004 still carry the column default of 0;
+    # recompute them with the same aggregate recalculate_total_price uses
+    Order = apps.get_model('api', 'Order')
+    price_field = models.DecimalField(max_digits=14, decimal_places=2)
+
+    orders = Order.objects.annotate(
+        computed_total=Coalesce(
+            Sum(F('items__quantity') * F('items__product__price'),
+                output_field=price_field),
+            Value(Decimal('0'), output_field=price_field)))
+
+    for order in orders.iterator(chunk_size=1000):
+        Order.objects.filter(pk=order.pk).update(
+            total_price=order.computed_total)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_product_updated_at_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_total_price, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,12 @@
+import os
+import time
 import uuid
 
 from decimal import Decimal
 
 from django.db import models
+from django.db.models import F, Sum, Value
+from django.db.models.functions import Coalesce
 from django.contrib.auth.models import AbstractUser
 
 
@@ -16,6 +20,22 @@ class Product(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     stock = models.PositiveIntegerField()
     image = models.ImageField(upload_to='products/', blank=True, null=True)
+    # Drives the ETag on the product read endpoints
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Filtering (ProductFilter) and ordering hit these columns
+        indexes = (
+            models.Index(fields=['name']),
+            models.Index(fields=['price']),
+            models.Index(fields=['stock']),
+            models.Index(fields=['updated_at']),
+            # Partial index matching InStockFilter's stock__gt=0 predicate
+            models.Index(
+                fields=['id'],
+                condition=models.Q(stock__gt=0),
+                name='product_in_stock_idx'),
+        )
 
     @property
     def in_stock(self) -> bool:
@@ -25,14 +45,33 @@ class Product(models.Model):
         return self.name
 
 
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUIDv7 (RFC 9562).
+
+    The leading 48-bit millisecond timestamp keeps new order PKs
+    appending to the right edge of the B-tree instead of landing on a
+    random leaf like uuid4, so inserts stay cache-friendly.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand_a = int.from_bytes(os.urandom(2), 'big') & 0x0FFF
+    rand_b = int.from_bytes(os.urandom(8), 'big') & 0x3FFFFFFFFFFFFFFF
+
+    return uuid.UUID(int=(
+        (timestamp_ms << 80)
+        | (0x7 << 76)
+        | (rand_a << 64)
+        | (0b10 << 62)
+        | rand_b))
+
+
 class Order(models.Model):
     class StatusChoices(models.TextChoices):
         PENDING = ('pending', 'Pending')
         CONFIRMED = ('confirmed', 'Confirmed')
         CANCELLED = ('cancelled', 'Cancelled')
 
-    order_id = models.UUIDField(primary_key=True, default=uuid.uuid4)
-    # order_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    order_id = models.UUIDField(primary_key=True, default=uuid7)
+    # order_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     # user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -40,6 +79,27 @@ class Order(models.Model):
         max_length=10, choices=StatusChoices.choices, default=StatusChoices.PENDING)
     products = models.ManyToManyField(
         Product, through='OrderItem', related_name='orders')
+    # Denormalized sum of item subtotals, maintained on every item write
+    # (api.signals + OrderCreateSerializer) so reads never recompute it
+    total_price = models.DecimalField(
+        max_digits=14, decimal_places=2, default=0)
+
+    def recalculate_total_price(self) -> None:
+        price_field = models.DecimalField(max_digits=14, decimal_places=2)
+        total = self.items.aggregate(
+            total=Coalesce(
+                Sum(F('quantity') * F('product__price'),
+                    output_field=price_field),
+                Value(Decimal('0'), output_field=price_field)))['total']
+
+        Order.objects.filter(pk=self.pk).update(total_price=total)
+        self.total_price = total
+
+    class Meta:
+        # Covers the per-user order listing with its date filtering
+        indexes = (
+            models.Index(fields=['user', 'created_at']),
+        )
 
     def __str__(self) -> str:
         return f'Order: {self.order_id} by {self.user.username}'
@@ -53,6 +113,12 @@ class OrderItem(models.Model):
 
     @property
     def item_subtotal(self) -> Decimal:
+        # Fast path: querysets may annotate price_cents so the hot loop
+        # multiplies plain ints instead of Decimals
+        price_cents = getattr(self, 'price_cents', None)
+        if price_cents is not None:
+            return Decimal(self.quantity * int(price_cents)) / 100
+
         return self.quantity * self.product.price
 
     def __str__(self) -> str:
@@ -4,7 +4,33 @@ from rest_framework import serializers
 from api.models import Product, Order, OrderItem, User
 
 
-class ProductSerializer(serializers.ModelSerializer):
+# Memoizes to_representation per (serializer class, instance pk). The
+# cache hangs off the root serializer, so it lives for a single top-level
+# serialization and repeated child objects (e.g. the same product across
+# many order items on one page) are rendered once. Kept as a comment
+# rather than a docstring: the serializers below have none of their own,
+# and drf-spectacular would publish an inherited docstring as the schema
+# description of every component using the mixin.
+class SerializerCacheMixin:
+
+    def to_representation(self, instance):
+        pk = getattr(instance, 'pk', None)
+        if pk is None:
+            return super().to_representation(instance)
+
+        root = self.root
+        cache = getattr(root, '_representation_cache', None)
+        if cache is None:
+            cache = root._representation_cache = {}
+
+        key = (type(self), pk)
+        if key not in cache:
+            cache[key] = super().to_representation(instance)
+
+        return cache[key]
+
+
+class ProductSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     class Meta:
         model = Product
         fields = ('name', 'description', 'price', 'stock')
@@ -16,7 +42,7 @@ class ProductSerializer(serializers.ModelSerializer):
         return value
 
 
-class OrderItemSerializer(serializers.ModelSerializer):
+class OrderItemSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     product_name = serializers.CharField(source='product.name')
     product_price = serializers.DecimalField(
         source='product.price', max_digits=10, decimal_places=2)
@@ -26,14 +52,13 @@ class OrderItemSerializer(serializers.ModelSerializer):
         fields = ('product_name', 'product_price', 'quantity', 'item_subtotal')
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     order_id = serializers.UUIDField(read_only=True)
-    items = OrderItemSerializer(many=True, read_only=True)
-    total_price = serializers.SerializerMethodField(
-        method_name='get_total_price')
-
-    def get_total_price(self, order) -> float:
-        return sum(item.item_subtotal for item in order.items.all())
+    items = OrderItemSerializer(
+        source='prefetched_items', many=True, read_only=True)
+    # Stored column maintained on item writes — reads never recompute it
+    total_price = serializers.DecimalField(
+        max_digits=14, decimal_places=2, read_only=True)
 
     class Meta:
         model = Order
@@ -58,11 +83,14 @@ class OrderCreateSerializer(serializers.ModelSerializer):
 
             if order_item_data is not None:
                 # Clear existing items (optional, depends on requirements)
-                instance.items.all().delete()
+                OrderItem.objects.filter(order=instance).delete()
 
-                # Recreate items with the updated data
-                for item in order_item_data:
-                    OrderItem.objects.create(order=instance, **item)
+                # Recreate items in a single multi-row INSERT; bulk_create
+                # skips post_save signals, so refresh the stored total here
+                OrderItem.objects.bulk_create(
+                    OrderItem(order=instance, **item)
+                    for item in order_item_data)
+                instance.recalculate_total_price()
 
         return instance
 
@@ -72,8 +100,10 @@ class OrderCreateSerializer(serializers.ModelSerializer):
         with transaction.atomic():
             order = Order.objects.create(**validated_data)
 
-            for item in order_item_data:
-                OrderItem.objects.create(order=order, **item)
+            OrderItem.objects.bulk_create(
+                OrderItem(order=order, **item)
+                for item in order_item_data)
+            order.recalculate_total_price()
 
         return order
 
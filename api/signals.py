@@ -0,0 +1,27 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.models import Order, OrderItem, Product
+
+
+@receiver(post_save, sender=OrderItem)
+@receiver(post_delete, sender=OrderItem)
+def update_order_total_price(sender, instance, **kwargs):
+    # Keeps the denormalized Order.total_price in sync with item writes;
+    # the order may already be gone when items cascade-delete with it
+    order = Order.objects.filter(pk=instance.order_id).first()
+    if order is not None:
+        order.recalculate_total_price()
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def bump_product_version(sender, instance, **kwargs):
+    # Invalidates cached product stats by rotating their cache key, and
+    # drops the per-product detail cache entry
+    cache.delete(f'product:{instance.pk}')
+    try:
+        cache.incr('product_ver')
+    except ValueError:
+        cache.set('product_ver', 1, timeout=None)
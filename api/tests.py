@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from django.test import TestCase
 from django.urls import reverse
 
@@ -48,3 +50,64 @@ class ProductAPITestCase(APITestCase):
         response = self.client.delete(self.url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Product.objects.filter(pk=self.product.pk).exists())
+
+
+class OrderTotalPriceAPITestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='customer', password='password', email='')
+        self.product = Product.objects.create(
+            name='Test Product',
+            description='Test Description',
+            price='5.00',
+            stock=10,
+        )
+        self.other_product = Product.objects.create(
+            name='Other Product',
+            description='Other Description',
+            price='2.50',
+            stock=10,
+        )
+        self.client.login(username='customer', password='password')
+        self.url = reverse('api:order-list')
+
+    def _create_order(self, product, quantity):
+        data = {'items': [{'product': product.pk, 'quantity': quantity}]}
+        return self.client.post(self.url, data, format='json')
+
+    def test_total_price_after_create(self):
+        response = self._create_order(self.product, 2)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        order = Order.objects.get()
+        self.assertEqual(order.total_price, Decimal('10.00'))
+
+        response = self.client.get(self.url)
+        self.assertEqual(
+            response.json()['results'][0]['total_price'], '10.00')
+
+    def test_total_price_after_items_update(self):
+        self._create_order(self.product, 2)
+        order = Order.objects.get()
+
+        detail_url = reverse('api:order-detail', kwargs={'pk': order.pk})
+        data = {'items': [{'product': self.other_product.pk, 'quantity': 3}]}
+        response = self.client.put(detail_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        order.refresh_from_db()
+        self.assertEqual(order.total_price, Decimal('7.50'))
+
+    def test_total_price_follows_item_writes(self):
+        self._create_order(self.product, 2)
+        order = Order.objects.get()
+        item = order.items.get()
+
+        item.quantity = 5
+        item.save()
+        order.refresh_from_db()
+        self.assertEqual(order.total_price, Decimal('25.00'))
+
+        item.delete()
+        order.refresh_from_db()
+        self.assertEqual(order.total_price, Decimal('0.00'))
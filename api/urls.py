@@ -11,6 +11,7 @@ urlpatterns = [
     path('products/<int:pk>/', views.ProductDetailAPIView.as_view(),
          name='product_detail'),
     path('products/info/', views.ProductInfoAPIView.as_view()),
+    path('products/export/', views.ProductExportAPIView.as_view()),
     # path('orders/', views.OrderListAPIView.as_view()),
     path('user-orders/', views.UserOrderListAPIView.as_view(), name='user_orders'),
     path('order-items/', views.OrderItemListAPIView.as_view()),
@@ -1,14 +1,23 @@
-from django.db.models import Max, Min
+import json
+
+from django.core.cache import cache
+from django.db import transaction
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, StreamingHttpResponse
+from django.db.models import Count, F, Max, Min, Prefetch
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import etag
 
 from rest_framework.response import Response
-from rest_framework import generics
+from rest_framework import generics, status
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.views import APIView
 
 from rest_framework import filters
 from django_filters.rest_framework import DjangoFilterBackend
 
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 from rest_framework import viewsets
 from rest_framework.decorators import action
@@ -16,6 +25,7 @@ from rest_framework.decorators import action
 from api.models import Product, Order, OrderItem, User
 from api.serializers import ProductSerializer, OrderSerializer, OrderItemSerializer, ProductsInfoSerializer, OrderCreateSerializer, UserSerializer
 from api.filters import ProductFilter, InStockFilter, OrderFilter
+from api.signals import bump_product_version
 
 
 class CustomPagination(PageNumberPagination):
@@ -25,8 +35,37 @@ class CustomPagination(PageNumberPagination):
     max_page_size = 5
 
 
+class ProductCursorPagination(CursorPagination):
+    # Keyset pagination: WHERE id > last_seen instead of COUNT(*) + OFFSET
+    ordering = 'id'
+    page_size = 3
+    page_size_query_param = 'size'
+    max_page_size = 5
+
+
+def _products_etag(request, *args, **kwargs):
+    # Any product write moves max(updated_at) or the count, so unchanged
+    # catalogs validate with a 304 instead of re-serializing
+    agg = Product.objects.aggregate(m=Max('updated_at'), c=Count('id'))
+    latest = agg['m'].timestamp() if agg['m'] else 0
+    return f'"{agg["c"]}-{latest}"'
+
+
+def _product_etag(request, *args, **kwargs):
+    updated_at = Product.objects.filter(
+        pk=kwargs['pk']).values_list('updated_at', flat=True).first()
+    return f'"{updated_at.timestamp()}"' if updated_at else None
+
+
+def product_read_queryset():
+    # Shared read projection: only the columns ProductSerializer renders
+    # (plus pk), so every product list skips the unused image column
+    return Product.objects.only('id', 'name', 'description', 'price', 'stock')
+
+
+@method_decorator(etag(_products_etag), name='dispatch')
 class ProductListCreateAPIView(generics.ListCreateAPIView):
-    queryset = Product.objects.order_by('pk')
+    queryset = product_read_queryset().order_by('pk')
     serializer_class = ProductSerializer
     filterset_class = ProductFilter
     filter_backends = (
@@ -37,7 +76,7 @@ class ProductListCreateAPIView(generics.ListCreateAPIView):
     )
     search_fields = ('name', 'description')
     ordering_fields = ('name', 'price', 'stock')
-    pagination_class = CustomPagination
+    pagination_class = ProductCursorPagination
 
     def get_permissions(self):
         self.permission_classes = (AllowAny,)
@@ -45,11 +84,76 @@ class ProductListCreateAPIView(generics.ListCreateAPIView):
             self.permission_classes = (IsAdminUser,)
         return super().get_permissions()
 
-
+    def create(self, request, *args, **kwargs):
+        # Import workflows can POST an array: all rows are validated up
+        # front and written in batched multi-row INSERTs instead of one
+        # request per product
+        if not isinstance(request.data, list):
+            return super().create(request, *args, **kwargs)
+
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+
+        # Atomic so a failure past the first batch can't commit a partial
+        # import; bulk_create skips post_save, so invalidate caches here
+        with transaction.atomic():
+            created = Product.objects.bulk_create(
+                (Product(**item) for item in serializer.validated_data),
+                batch_size=500)
+
+            for product in created:
+                bump_product_version(Product, product)
+
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def list(self, request, *args, **kwargs):
+        # Read-only rows come back as dicts straight from the cursor,
+        # skipping model instantiation and the ModelSerializer field walk.
+        # POST still goes through ProductSerializer validation.
+        # id is included so the cursor paginator can read its position
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            'id', *ProductSerializer.Meta.fields)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(
+                [self._present_row(row) for row in page])
+
+        return Response([self._present_row(row) for row in queryset])
+
+    @staticmethod
+    def _present_row(row):
+        # Match ProductSerializer's wire format: DecimalField renders as
+        # a string, and id exists only to position the cursor paginator
+        row.pop('id')
+        row['price'] = f'{row["price"]:.2f}'
+        return row
+
+
+@method_decorator(etag(_product_etag), name='dispatch')
 class ProductDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Product.objects.all()
     serializer_class = ProductSerializer
 
+    def get_object(self):
+        # Hot product ids serve reads from the cache for 15s; writes on
+        # this view and Product signals both invalidate the key, and
+        # update/delete always fetch fresh rows
+        if self.request.method != 'GET':
+            return super().get_object()
+
+        pk = self.kwargs['pk']
+        product = cache.get_or_set(
+            f'product:{pk}',
+            lambda: Product.objects.filter(pk=pk).first(),
+            timeout=15)
+
+        if product is None:
+            raise Http404
+
+        self.check_object_permissions(self.request, product)
+        return product
+
     def get_permissions(self):
         self.permission_classes = (AllowAny,)
         if self.request.method in ('POST', 'PUT', 'PATCH', 'DELETE'):
@@ -57,27 +161,91 @@ class ProductDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
         return super().get_permissions()
 
 
+def get_product_stats() -> dict:
+    """Aggregate product stats, memoized for 60s.
+
+    The key embeds a version counter that api.signals bumps on every
+    Product write, so stale stats are never served after a change.
+    """
+    version = cache.get('product_ver', 0)
+    return cache.get_or_set(
+        f'product_stats:{version}',
+        lambda: Product.objects.aggregate(
+            count=Count('id'),
+            max_price=Max('price'),
+            min_price=Min('price')),
+        timeout=60)
+
+
+# Read-heavy dashboard data: hot hits skip the DB entirely for 30s;
+# the short TTL bounds staleness after a product write
+@method_decorator(cache_page(30), name='dispatch')
 class ProductInfoAPIView(APIView):
     serializer_class = ProductsInfoSerializer
 
     def get(self, request):
-        products = Product.objects.all()
+        # iterator() streams rows in chunks instead of caching the whole
+        # table on the queryset; the serializer walks it exactly once
+        products = product_read_queryset().iterator(chunk_size=1000)
+
+        stats = get_product_stats()
 
         serializer = ProductsInfoSerializer({
             'products': products,
-            'count': len(products),
-            'max_price': products.aggregate(max_price=Max('price'))['max_price'],
-            'min_price': products.aggregate(min_price=Min('price'))['min_price']
+            'count': stats['count'],
+            'max_price': stats['max_price'],
+            'min_price': stats['min_price']
         })
 
         return Response(serializer.data)
 
 
+# to_attr stores the prefetched rows as a plain list, so nested
+# serialization skips the RelatedManager's .all() machinery
+ORDER_ITEMS_PREFETCH = Prefetch(
+    'items',
+    # only() is narrowed to what OrderItemSerializer renders; the FK id
+    # columns must stay in the projection or the prefetch re-queries
+    queryset=OrderItem.objects.select_related('product').only(
+        'id', 'order_id', 'quantity',
+        'product__id', 'product__name', 'product__price').annotate(
+        price_cents=F('product__price') * 100),
+    to_attr='prefetched_items')
+
+
+class ProductExportAPIView(APIView):
+    """Stream the whole catalog as one JSON array.
+
+    Pagination is no help for bulk exports, so rows are pulled through a
+    chunked DB cursor and flushed as they arrive: peak memory stays at
+    O(chunk_size) and the first bytes leave before the last row is read.
+    """
+
+    serializer_class = ProductSerializer
+
+    def get(self, request):
+        def stream():
+            yield '['
+            first = True
+            for row in Product.objects.values(
+                    'id', 'name', 'description', 'price', 'stock'
+            ).iterator(chunk_size=2000):
+                if not first:
+                    yield ','
+                first = False
+                yield json.dumps(row, cls=DjangoJSONEncoder)
+            yield ']'
+
+        return StreamingHttpResponse(
+            stream(), content_type='application/json')
+
+
 class OrderViewSet(viewsets.ModelViewSet):
-    queryset = Order.objects.prefetch_related('items__product')
+    # Deterministic ordering keeps page boundaries stable under pagination
+    queryset = Order.objects.select_related('user').prefetch_related(
+        ORDER_ITEMS_PREFETCH).order_by('-created_at')
     serializer_class = OrderSerializer
     permission_classes = (IsAuthenticated,)
-    pagination_class = None
     filter_backends = (DjangoFilterBackend,)
     filterset_class = OrderFilter
 
@@ -100,21 +268,30 @@ class OrderViewSet(viewsets.ModelViewSet):
 
 
 class UserOrderListAPIView(generics.ListAPIView):
-    queryset = Order.objects.all()
+    # Sentinel for schema generation; real rows come from get_queryset
+    queryset = Order.objects.none()
     serializer_class = OrderSerializer
     permission_classes = (IsAuthenticated, )
 
     def get_queryset(self):
-        qs = super().get_queryset()
-        return qs.filter(user=self.request.user)
+        # Schema generation visits this with AnonymousUser
+        if getattr(self, 'swagger_fake_view', False):
+            return super().get_queryset()
+
+        # Only the serialized columns, newest first — the filter and the
+        # ordering both ride the (user, created_at) index
+        return Order.objects.filter(user=self.request.user).only(
+            'order_id', 'user', 'created_at', 'status', 'total_price'
+        ).prefetch_related(ORDER_ITEMS_PREFETCH).order_by('-created_at')
 
 
 class OrderItemListAPIView(generics.ListAPIView):
-    queryset = OrderItem.objects.all()
+    queryset = OrderItem.objects.select_related(
+        'order', 'product').order_by('pk')
     serializer_class = OrderItemSerializer
 
 
 class UserListAPIView(generics.ListAPIView):
-    queryset = User.objects.all()
+    # Deterministic ordering keeps page boundaries stable under pagination
+    queryset = User.objects.order_by('pk')
     serializer_class = UserSerializer
-    pagination_class = None
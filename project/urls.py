@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 
@@ -15,9 +16,6 @@ urlpatterns = [
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
 
-    # Silk URLs
-    path('silk/', include('silk.urls', namespace='silk')),
-
     # YOUR PATTERNS
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     # Optional UI:
@@ -30,3 +28,7 @@ urlpatterns = [
     path('', include('api.urls')),
     # path('api-auth/', include('rest_framework.urls'))
 ]
+
+# Silk URLs (profiling is only installed when DEBUG is on)
+if settings.DEBUG:
+    urlpatterns += [path('silk/', include('silk.urls', namespace='silk'))]